@@ -54,8 +54,12 @@ class HLL(RiemannSolver):
         speed_of_sound_left = self.material_manager.get_speed_of_sound(p = primes_L[4], rho = primes_L[0])
         speed_of_sound_right = self.material_manager.get_speed_of_sound(p = primes_R[4], rho = primes_R[0])
         
-        wave_speed_simple_L, wave_speed_simple_R = self.signal_speed(primes_L[axis+1], primes_R[axis+1], speed_of_sound_left, speed_of_sound_right, 
-            rho_L = primes_L[0], rho_R = primes_R[0], p_L = primes_L[4], p_R = primes_R[4], gamma = self.material_manager.gamma)
+        total_enthalpy_left = self.material_manager.get_total_enthalpy(p = primes_L[4], rho = primes_L[0], u = primes_L[1], v = primes_L[2], w = primes_L[3])
+        total_enthalpy_right = self.material_manager.get_total_enthalpy(p = primes_R[4], rho = primes_R[0], u = primes_R[1], v = primes_R[2], w = primes_R[3])
+
+        wave_speed_simple_L, wave_speed_simple_R = self.signal_speed(primes_L[axis+1], primes_R[axis+1], speed_of_sound_left, speed_of_sound_right,
+            rho_L = primes_L[0], rho_R = primes_R[0], H_L = total_enthalpy_left, H_R = total_enthalpy_right,
+            p_L = primes_L[4], p_R = primes_R[4], gamma = self.material_manager.gamma)
         wave_speed_left  = jnp.minimum( wave_speed_simple_L, 0.0 )
         wave_speed_right = jnp.maximum( wave_speed_simple_R, 0.0 )
 
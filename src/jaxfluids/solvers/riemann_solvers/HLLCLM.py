@@ -57,8 +57,12 @@ class HLLCLM(RiemannSolver):
         speed_of_sound_left = self.material_manager.get_speed_of_sound(p = cell_state_L[4], rho = cell_state_L[0])
         speed_of_sound_right = self.material_manager.get_speed_of_sound(p = cell_state_R[4], rho = cell_state_R[0])
 
-        wave_speed_simple_L, wave_speed_simple_R = self.signal_speed(cell_state_L[axis+1], cell_state_R[axis+1], speed_of_sound_left, speed_of_sound_right, 
-            rho_L = cell_state_L[0], rho_R = cell_state_R[0], p_L = cell_state_L[4], p_R = cell_state_R[4], gamma = self.material_manager.gamma)
+        total_enthalpy_left = self.material_manager.get_total_enthalpy(p = cell_state_L[4], rho = cell_state_L[0], u = cell_state_L[1], v = cell_state_L[2], w = cell_state_L[3])
+        total_enthalpy_right = self.material_manager.get_total_enthalpy(p = cell_state_R[4], rho = cell_state_R[0], u = cell_state_R[1], v = cell_state_R[2], w = cell_state_R[3])
+
+        wave_speed_simple_L, wave_speed_simple_R = self.signal_speed(cell_state_L[axis+1], cell_state_R[axis+1], speed_of_sound_left, speed_of_sound_right,
+            rho_L = cell_state_L[0], rho_R = cell_state_R[0], H_L = total_enthalpy_left, H_R = total_enthalpy_right,
+            p_L = cell_state_L[4], p_R = cell_state_R[4], gamma = self.material_manager.gamma)
         wave_speed_contact = self.s_star(cell_state_L[axis+1], cell_state_R[axis+1], cell_state_L[4], cell_state_R[4], cell_state_L[0], cell_state_R[0],
             wave_speed_simple_L, wave_speed_simple_R)
 
@@ -36,7 +36,7 @@ from jaxfluids.solvers.riemann_solvers.Rusanov import Rusanov
 from jaxfluids.solvers.riemann_solvers.RusanovNN import RusanovNN
 
 from jaxfluids.solvers.riemann_solvers.signal_speeds import signal_speed_Arithmetic, signal_speed_Rusanov, signal_speed_Davis, signal_speed_Davis_2,\
-    signal_speed_Einfeldt, signal_speed_Toro
+    signal_speed_Davis_2_fp32, signal_speed_Einfeldt, signal_speed_Einfeldt_fp32, signal_speed_Toro, signal_speed, DICT_SIGNAL_SPEED_KINDS, SignalSpeeds
 
 DICT_RIEMANN_SOLVER ={
     'HLL': HLL,
@@ -51,6 +51,8 @@ DICT_SIGNAL_SPEEDS ={
     'RUSANOV': signal_speed_Rusanov,
     'DAVIS': signal_speed_Davis,
     'DAVIS2': signal_speed_Davis_2,
+    'DAVIS2_FP32': signal_speed_Davis_2_fp32,
     'EINFELDT': signal_speed_Einfeldt,
+    'EINFELDT_FP32': signal_speed_Einfeldt_fp32,
     'TORO': signal_speed_Toro,
 }
\ No newline at end of file
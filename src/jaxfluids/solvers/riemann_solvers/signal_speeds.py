@@ -29,13 +29,54 @@
 #*                                                                              *
 #*------------------------------------------------------------------------------*
 
-from typing import Tuple
+import os
+from functools import wraps
+from typing import Callable, NamedTuple, Sequence, Union
 
 import jax
-import jax.numpy as jnp 
+import jax.numpy as jnp
+from jax.config import config
 
+class SignalSpeeds(NamedTuple):
+    """Pair of left and right going wave speed estimates.
+
+    Behaves like the plain (S_L, S_R) tuple previously returned by the
+    estimators, but keeps the pair as one pytree node so downstream
+    consumers can pass it around as a single object.
+    """
+    S_L: jax.Array
+    S_R: jax.Array
+
+def _jit_with_static_gamma(fun: Callable) -> Callable:
+    """Jit-compiles a signal speed estimator with gamma as a static argument
+    whenever gamma is a Python scalar. A static gamma is baked into the
+    executable as an immediate constant, so XLA folds expressions like
+    (gamma + 1) * 0.5 / gamma at compile time. Two-phase material managers
+    pass gamma as a per-phase buffer, which is not hashable; such calls fall
+    back to the executable with traced gamma.
+
+    :param fun: Signal speed estimator with a gamma argument.
+    :type fun: Callable
+    :return: Wrapper dispatching between the two jit-compiled executables.
+    :rtype: Callable
+    """
+    jit_traced = jax.jit(fun)
+    jit_static_gamma = jax.jit(fun, static_argnames=("gamma",))
+
+    @wraps(fun)
+    def wrapper(*args, **kwargs):
+        gamma = kwargs.get("gamma", args[8] if len(args) > 8 else None)
+        if isinstance(gamma, (int, float)):
+            return jit_static_gamma(*args, **kwargs)
+        return jit_traced(*args, **kwargs)
+
+    wrapper.jit_traced = jit_traced
+    wrapper.jit_static_gamma = jit_static_gamma
+    return wrapper
+
+@jax.jit
 def signal_speed_Arithmetic(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
-    *args, **kwargs) -> Tuple[jax.Array, jax.Array]:
+    *args, **kwargs) -> SignalSpeeds:
     """Arithmetic signal speed estimate
 
     :param u_L: Buffer with normal velocity in left neighboring cell.
@@ -47,16 +88,17 @@ def signal_speed_Arithmetic(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R:
     :param a_R: Buffer with speed of sound in right neighboring cell.
     :type a_R: jax.Array
     :return: Buffers of left and right going wave speed estimates.
-    :rtype: Tuple[jax.Array, jax.Array]
+    :rtype: SignalSpeeds
     """
     u_mean = 0.5 * (u_L + u_R)
     a_mean = 0.5 * (a_L + a_R)
     S_L = jnp.minimum(u_mean - a_mean, u_L - a_L)
     S_R = jnp.maximum(u_mean + a_mean, u_R + a_R)
-    return S_L, S_R
+    return SignalSpeeds(S_L, S_R)
 
+@jax.jit
 def signal_speed_Rusanov(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
-    *args, **kwargs) -> Tuple[jax.Array, jax.Array]:
+    *args, **kwargs) -> SignalSpeeds:
     """Rusanov type signal speed estimate
 
     :param u_L: Buffer with normal velocity in left neighboring cell.
@@ -68,15 +110,14 @@ def signal_speed_Rusanov(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: ja
     :param a_R: Buffer with speed of sound in right neighboring cell.
     :type a_R: jax.Array
     :return: Buffers of left and right going wave speed estimates.
-    :rtype: Tuple[jax.Array, jax.Array]
+    :rtype: SignalSpeeds
     """
-    S_plus = jnp.maximum(jnp.abs(u_L) + a_L, jnp.abs(u_R) + a_R)
-    S_L = - S_plus
-    S_R = S_plus
-    return S_L, S_R
+    S_plus = jnp.maximum(jax.lax.abs(u_L) + a_L, jax.lax.abs(u_R) + a_R)
+    return SignalSpeeds(-S_plus, S_plus)
 
+@jax.jit
 def signal_speed_Davis(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
-    *args, **kwargs) -> Tuple[jax.Array, jax.Array]:
+    *args, **kwargs) -> SignalSpeeds:
     """Davis signal speed estimate
     See Toro Eq. (10.48)
 
@@ -89,15 +130,16 @@ def signal_speed_Davis(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.
     :param a_R: Buffer with speed of sound in right neighboring cell.
     :type a_R: jax.Array
     :return: Buffers of left and right going wave speed estimates.
-    :rtype: Tuple[jax.Array, jax.Array]
+    :rtype: SignalSpeeds
     """
     S_L = jnp.minimum( u_L - a_L, u_R - a_R )
     S_R = jnp.maximum( u_L + a_L, u_R + a_R )
-    return S_L, S_R
+    return SignalSpeeds(S_L, S_R)
 
+@_jit_with_static_gamma
 def signal_speed_Davis_2(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
     rho_L: jax.Array, rho_R: jax.Array, H_L: jax.Array, H_R: jax.Array, gamma: float,
-    *args, **kwargs) -> Tuple[jax.Array, jax.Array]:
+    *args, **kwargs) -> SignalSpeeds:
     """Signal speed estimate according to Davis.
 
     :param u_L: Buffer with normal velocity in left neighboring cell.
@@ -119,19 +161,42 @@ def signal_speed_Davis_2(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: ja
     :param gamma: Ratio of specific heats.
     :type gamma: float
     :return: Buffers of left and right going wave speed estimates.
-    :rtype: Tuple[jax.Array, jax.Array]
+    :rtype: SignalSpeeds
     """
 
-    one_dens = 1.0 / (jnp.sqrt(rho_L) + jnp.sqrt(rho_R))
-    u_Roe = ( jnp.sqrt(rho_L) * u_L + jnp.sqrt(rho_R) * u_R ) * one_dens
-    H_Roe = ( jnp.sqrt(rho_L) * H_L + jnp.sqrt(rho_R) * H_R ) * one_dens
-    a_Roe = jnp.sqrt( (gamma - 1) * (H_Roe - 0.5 * u_Roe * u_Roe) )
+    sqrt_rho_L = jnp.sqrt(rho_L)
+    sqrt_rho_R = jnp.sqrt(rho_R)
+    one_dens = 1.0 / (sqrt_rho_L + sqrt_rho_R)
+    u_Roe = ( sqrt_rho_L * u_L + sqrt_rho_R * u_R ) * one_dens
+    H_Roe = ( sqrt_rho_L * H_L + sqrt_rho_R * H_R ) * one_dens
+    a_Roe = jnp.sqrt( (gamma - 1) * jnp.maximum( H_Roe - 0.5 * jnp.square(u_Roe), 0.0 ) )
     S_L = u_Roe - a_Roe
     S_R = u_Roe + a_Roe
-    return S_L, S_R
+    return SignalSpeeds(S_L, S_R)
 
+def signal_speed_Davis_2_fp32(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
+    rho_L: jax.Array, rho_R: jax.Array, H_L: jax.Array, H_R: jax.Array, gamma: float,
+    *args, **kwargs) -> SignalSpeeds:
+    """Single-precision variant of signal_speed_Davis_2.
+
+    Opt-in estimator for double-precision runs that evaluates the Roe
+    averages in single precision and casts the wave speeds back to the
+    caller dtype. Note that the estimates enter the star-state algebra of
+    the HLLC-type solvers, so the reduced precision perturbs the fluxes and
+    their gradients; the default estimator stays fully double precision.
+
+    :return: Buffers of left and right going wave speed estimates.
+    :rtype: SignalSpeeds
+    """
+    dtype_in = u_L.dtype
+    S_L, S_R = signal_speed_Davis_2(u_L.astype(jnp.float32), u_R.astype(jnp.float32),
+        a_L.astype(jnp.float32), a_R.astype(jnp.float32), rho_L.astype(jnp.float32),
+        rho_R.astype(jnp.float32), H_L.astype(jnp.float32), H_R.astype(jnp.float32), gamma)
+    return SignalSpeeds(S_L.astype(dtype_in), S_R.astype(dtype_in))
+
+@jax.jit
 def signal_speed_Einfeldt(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
-    rho_L: jax.Array, rho_R: jax.Array, *args, **kwargs) -> Tuple[jax.Array, jax.Array]:
+    rho_L: jax.Array, rho_R: jax.Array, *args, **kwargs) -> SignalSpeeds:
     """Einfeldt signal speed estimate
     See Toro Eqs. (10.52) - (10.54) 
 
@@ -144,21 +209,43 @@ def signal_speed_Einfeldt(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: j
     :param a_R: Buffer with speed of sound in right neighboring cell.
     :type a_R: jax.Array
     :return: Buffers of left and right going wave speed estimates.
-    :rtype: Tuple[jax.Array, jax.Array]
+    :rtype: SignalSpeeds
     """
-    one_dens = 1.0 / (jnp.sqrt(rho_L) + jnp.sqrt(rho_R))
-    eta2 = 0.5 * jnp.sqrt(rho_L) * jnp.sqrt(rho_R) * one_dens * one_dens
-    u_bar = ( jnp.sqrt(rho_L) * u_L + jnp.sqrt(rho_R) * u_R ) * one_dens
-    d_bar = jnp.sqrt( ( jnp.sqrt(rho_L) * a_L * a_L + jnp.sqrt(rho_R) * a_R * a_R ) * one_dens + eta2 * (u_R - u_L) * (u_R - u_L) )
+    sqrt_rho_L = jnp.sqrt(rho_L)
+    sqrt_rho_R = jnp.sqrt(rho_R)
+    one_dens = 1.0 / (sqrt_rho_L + sqrt_rho_R)
+    eta2 = 0.5 * sqrt_rho_L * sqrt_rho_R * jnp.square(one_dens)
+    u_bar = ( sqrt_rho_L * u_L + sqrt_rho_R * u_R ) * one_dens
+    d_bar = jnp.sqrt( ( sqrt_rho_L * jnp.square(a_L) + sqrt_rho_R * jnp.square(a_R) ) * one_dens + eta2 * jnp.square(u_R - u_L) )
     S_L = u_bar - d_bar
     S_R = u_bar + d_bar
-    return S_L, S_R
+    return SignalSpeeds(S_L, S_R)
+
+def signal_speed_Einfeldt_fp32(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
+    rho_L: jax.Array, rho_R: jax.Array, *args, **kwargs) -> SignalSpeeds:
+    """Single-precision variant of signal_speed_Einfeldt.
 
+    Opt-in estimator for double-precision runs that evaluates the Einfeldt
+    estimate in single precision and casts the wave speeds back to the
+    caller dtype. Note that the estimates enter the star-state algebra of
+    the HLLC-type solvers, so the reduced precision perturbs the fluxes and
+    their gradients; the default estimator stays fully double precision.
+
+    :return: Buffers of left and right going wave speed estimates.
+    :rtype: SignalSpeeds
+    """
+    dtype_in = u_L.dtype
+    S_L, S_R = signal_speed_Einfeldt(u_L.astype(jnp.float32), u_R.astype(jnp.float32),
+        a_L.astype(jnp.float32), a_R.astype(jnp.float32), rho_L.astype(jnp.float32),
+        rho_R.astype(jnp.float32))
+    return SignalSpeeds(S_L.astype(dtype_in), S_R.astype(dtype_in))
+
+@_jit_with_static_gamma
 def signal_speed_Toro(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
     rho_L: jax.Array, rho_R: jax.Array, p_L: jax.Array, p_R: jax.Array, gamma: float, 
-    *args, **kwargs) -> Tuple[jax.Array, jax.Array]:
+    *args, **kwargs) -> SignalSpeeds:
     """Toro signal speed estimate
-    See Toro Eqs. (10.59) - (10.60) 
+    See Toro Eqs. (10.59) - (10.60)
 
     :param u_L: Buffer with normal velocity in left neighboring cell.
     :type u_L: jax.Array
@@ -168,15 +255,151 @@ def signal_speed_Toro(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.A
     :type a_L: jax.Array
     :param a_R: Buffer with speed of sound in right neighboring cell.
     :type a_R: jax.Array
-    :rtype: Tuple[jax.Array, jax.Array]
+    :rtype: SignalSpeeds
     """
-    p_star = estimate_pressure(u_L, u_R, a_L, a_R, rho_L, rho_R, p_L, p_R)
+    # Inlined estimate_pressure, see Toro Eq. (9.28) or (10.67), so that the
+    # PVRS estimate fuses with the q factors within this jit boundary.
+    rho_bar = 0.5 * (rho_L + rho_R)
+    a_bar = 0.5 * (a_L + a_R)
+    p_pvrs = 0.5 * (p_L + p_R - (u_R - u_L) * rho_bar * a_bar)
+    p_star = jnp.maximum(p_pvrs, 0.0)
     gamma_ = (gamma + 1) * 0.5 / gamma
-    q_L = 1.0 * (p_star <= p_L) + jnp.sqrt( 1 + gamma_ * (p_star / p_L - 1) ) * (p_star > p_L)
-    q_R = 1.0 * (p_star <= p_R) + jnp.sqrt( 1 + gamma_ * (p_star / p_R - 1) ) * (p_star > p_R)
+    q_L = jnp.where( p_star > p_L, jnp.sqrt( jnp.maximum( 1 + gamma_ * (p_star / p_L - 1), 0.0 ) ), 1.0 )
+    q_R = jnp.where( p_star > p_R, jnp.sqrt( jnp.maximum( 1 + gamma_ * (p_star / p_R - 1), 0.0 ) ), 1.0 )
     S_L = u_L - a_L * q_L
     S_R = u_R + a_R * q_R
-    return S_L, S_R
+    return SignalSpeeds(S_L, S_R)
+
+_SIGNAL_SPEED_FNS = (signal_speed_Arithmetic, signal_speed_Rusanov, signal_speed_Davis,
+    signal_speed_Davis_2, signal_speed_Einfeldt, signal_speed_Toro)
+
+DICT_SIGNAL_SPEED_KINDS = {
+    'ARITHMETIC': 0,
+    'RUSANOV': 1,
+    'DAVIS': 2,
+    'DAVIS2': 3,
+    'EINFELDT': 4,
+    'TORO': 5,
+}
+
+@jax.jit
+def signal_speed(kind: Union[int, jax.Array], u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array,
+    rho_L: jax.Array, rho_R: jax.Array, H_L: jax.Array, H_R: jax.Array, p_L: jax.Array, p_R: jax.Array,
+    gamma: float) -> SignalSpeeds:
+    """Unified signal speed estimate dispatching on an integer kind.
+
+    Selects between the six signal speed estimators via jax.lax.switch so
+    that the choice of estimator is part of a single traced graph and does
+    not introduce a Python-level dispatch per call. The kind corresponds to
+    DICT_SIGNAL_SPEED_KINDS. Since all estimators are dispatched within one
+    traced region, the full argument set has to be provided.
+
+    :param kind: Integer id of the signal speed estimate, see DICT_SIGNAL_SPEED_KINDS.
+    :type kind: Union[int, jax.Array]
+    :param u_L: Buffer with normal velocity in left neighboring cell.
+    :type u_L: jax.Array
+    :param u_R: Buffer with normal velocity in right neighboring cell.
+    :type u_R: jax.Array
+    :param a_L: Buffer with speed of sound in left neighboring cell.
+    :type a_L: jax.Array
+    :param a_R: Buffer with speed of sound in right neighboring cell.
+    :type a_R: jax.Array
+    :param rho_L: Buffer with densities in left neighboring cell.
+    :type rho_L: jax.Array
+    :param rho_R: Buffer with densities in right neighboring cell.
+    :type rho_R: jax.Array
+    :param H_L: Buffer with total enthalpies in left neighboring cell.
+    :type H_L: jax.Array
+    :param H_R: Buffer with total enthalpies in right neighboring cell.
+    :type H_R: jax.Array
+    :param p_L: Buffer with pressures in left neighboring cell.
+    :type p_L: jax.Array
+    :param p_R: Buffer with pressures in right neighboring cell.
+    :type p_R: jax.Array
+    :param gamma: Ratio of specific heats.
+    :type gamma: float
+    :return: Buffers of left and right going wave speed estimates.
+    :rtype: SignalSpeeds
+    """
+    branches = [
+        ( lambda fun=fun: fun(u_L, u_R, a_L, a_R, rho_L=rho_L, rho_R=rho_R,
+            H_L=H_L, H_R=H_R, p_L=p_L, p_R=p_R, gamma=gamma) )
+        for fun in _SIGNAL_SPEED_FNS
+    ]
+    return jax.lax.switch(kind, branches)
+
+def signal_speed_LR(signal_speed_fn: Callable, u_LR: jax.Array, a_LR: jax.Array,
+    rho_LR: jax.Array = None, H_LR: jax.Array = None, p_LR: jax.Array = None,
+    gamma: float = None) -> SignalSpeeds:
+    """Evaluates a signal speed estimate on buffers with stacked left/right layout.
+
+    Adapter for callers that keep the left and right cell face states of a
+    quantity in a single buffer with the L/R pair on the leading axis, e.g.
+    u_LR = jnp.stack([u_L, u_R]). Each quantity is then one contiguous buffer
+    instead of two separate ones. Within the solver itself the reconstruction
+    stencils emit separate left and right buffers, hence the estimators keep
+    their two-buffer signatures and this adapter slices views at zero cost.
+
+    :param signal_speed_fn: Signal speed estimator, e.g. signal_speed_Einfeldt.
+    :type signal_speed_fn: Callable
+    :param u_LR: Buffer with normal velocities, L/R stacked on the leading axis.
+    :type u_LR: jax.Array
+    :param a_LR: Buffer with speeds of sound, L/R stacked on the leading axis.
+    :type a_LR: jax.Array
+    :param rho_LR: Buffer with densities, L/R stacked on the leading axis, defaults to None
+    :type rho_LR: jax.Array, optional
+    :param H_LR: Buffer with total enthalpies, L/R stacked on the leading axis, defaults to None
+    :type H_LR: jax.Array, optional
+    :param p_LR: Buffer with pressures, L/R stacked on the leading axis, defaults to None
+    :type p_LR: jax.Array, optional
+    :param gamma: Ratio of specific heats, defaults to None
+    :type gamma: float, optional
+    :return: Buffers of left and right going wave speed estimates.
+    :rtype: SignalSpeeds
+    """
+    kwargs = {}
+    if rho_LR is not None:
+        kwargs.update(rho_L=rho_LR[0], rho_R=rho_LR[1])
+    if H_LR is not None:
+        kwargs.update(H_L=H_LR[0], H_R=H_LR[1])
+    if p_LR is not None:
+        kwargs.update(p_L=p_LR[0], p_R=p_LR[1])
+    if gamma is not None:
+        kwargs.update(gamma=gamma)
+    return signal_speed_fn(u_LR[0], u_LR[1], a_LR[0], a_LR[1], **kwargs)
+
+def signal_speed_batch(signal_speed_fn: Callable, u_L: Sequence, u_R: Sequence,
+    a_L: Sequence, a_R: Sequence, **kwargs) -> SignalSpeeds:
+    """Evaluates a signal speed estimate once for multiple spatial directions.
+
+    Stacks the per-direction face buffers along a new leading axis and calls
+    the estimator a single time on the stacked slabs, instead of launching
+    one elementwise kernel per direction. The returned wave speed buffers
+    carry the direction on the leading axis in the order of the input
+    sequences. Since the estimators are purely elementwise, the batched
+    evaluation is exact; it requires the face buffers of all batched
+    directions to have the same shape, e.g. on grids with equal resolution
+    per active axis.
+
+    :param signal_speed_fn: Signal speed estimator, e.g. signal_speed_Einfeldt.
+    :type signal_speed_fn: Callable
+    :param u_L: Per-direction buffers with normal velocity in left neighboring cell.
+    :type u_L: Sequence
+    :param u_R: Per-direction buffers with normal velocity in right neighboring cell.
+    :type u_R: Sequence
+    :param a_L: Per-direction buffers with speed of sound in left neighboring cell.
+    :type a_L: Sequence
+    :param a_R: Per-direction buffers with speed of sound in right neighboring cell.
+    :type a_R: Sequence
+    :return: Buffers of left and right going wave speed estimates, direction on the leading axis.
+    :rtype: SignalSpeeds
+    """
+    stacked_kwargs = {
+        key: jnp.stack(value) if isinstance(value, (list, tuple)) else value
+        for key, value in kwargs.items()
+    }
+    return signal_speed_fn(jnp.stack(u_L), jnp.stack(u_R), jnp.stack(a_L), jnp.stack(a_R),
+        **stacked_kwargs)
 
 def compute_sstar(u_L: jax.Array, u_R: jax.Array, p_L: jax.Array, p_R: jax.Array, 
     rho_L: jax.Array, rho_R: jax.Array, S_L: jax.Array, S_R: jax.Array) -> jax.Array:
@@ -207,7 +430,13 @@ def compute_sstar(u_L: jax.Array, u_R: jax.Array, p_L: jax.Array, p_R: jax.Array
     delta_uL = S_L - u_L
     delta_uR = S_R - u_R
     rho_deltaSU = rho_L * delta_uL - rho_R * delta_uR
-    S_star = 1.0 / rho_deltaSU * (p_R - p_L + rho_L * u_L * delta_uL - rho_R * u_R * delta_uR)
+    numerator = p_R - p_L + rho_L * u_L * delta_uL - rho_R * u_R * delta_uR
+    # Guard against vanishing denominators at contact discontinuities. The
+    # denominator is forced to one on the masked side so that neither the
+    # primal evaluation nor the backward pass produces NaNs.
+    mask = jnp.abs(rho_deltaSU) > jnp.finfo(rho_deltaSU.dtype).eps
+    denominator = jnp.where(mask, rho_deltaSU, 1.0)
+    S_star = jnp.where(mask, numerator / denominator, 0.5 * (u_L + u_R))
     return S_star
 
 def estimate_pressure(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.Array, 
@@ -238,6 +467,62 @@ def estimate_pressure(u_L: jax.Array, u_R: jax.Array, a_L: jax.Array, a_R: jax.A
     """
     rho_bar = 0.5 * (rho_L + rho_R)
     a_bar = 0.5 * (a_L + a_R)
-    p_pvrs = 0.5 * (p_L + p_R) - 0.5 * (u_R - u_L) * rho_bar * a_bar
-    p_star = jnp.maximum(0.0, p_pvrs)
-    return p_star
\ No newline at end of file
+    p_pvrs = 0.5 * (p_L + p_R - (u_R - u_L) * rho_bar * a_bar)
+    p_star = jnp.maximum(p_pvrs, 0.0)
+    return p_star
+
+def precompile_signal_speeds(shape: Sequence, dtype: type = None, gamma: float = 1.4) -> None:
+    """Ahead-of-time compiles the signal speed estimators for a given shape.
+
+    Lowers and compiles the jitted estimators for face buffers of the given
+    shape and dtype, so that the first integration step of a production run
+    does not pay the tracing and compilation latency. The estimators are
+    lowered with the calling convention of the Riemann solvers - four
+    positional buffers plus the rho/H/p keyword buffers and a scalar gamma -
+    since the jit cache is keyed on the exact argument split and entries
+    lowered with a narrower signature would never be hit. The compiled
+    executables land in the regular jit cache of the estimators; combined
+    with the persistent jax compilation cache, subsequent processes skip
+    the XLA compilation entirely. Triggered at import time when the
+    environment variable JAXFLUIDS_PRECOMPILE_SHAPE is set to a
+    comma-separated face-buffer shape with an optional dtype suffix, e.g.
+    "257,256,256" or "257,256,256:float64". Requesting float64 enables x64
+    mode, which otherwise would only be switched on later by the
+    SimulationManager and the import-time compilation would target float32
+    executables that double-precision runs never hit.
+
+    :param shape: Shape of the face buffers to compile for.
+    :type shape: Sequence
+    :param dtype: Dtype of the face buffers, defaults to the active float precision
+    :type dtype: type, optional
+    :param gamma: Ratio of specific heats, defaults to 1.4
+    :type gamma: float, optional
+    """
+    if dtype is None:
+        dtype = jnp.zeros(()).dtype
+    buffer = jax.ShapeDtypeStruct(tuple(shape), dtype)
+    # Mirror of the keyword split used by HLL/HLLC/HLLCLM when invoking
+    # self.signal_speed; surplus keywords become traced jit inputs and are
+    # part of the cache key.
+    keyword_buffers = {
+        "rho_L": buffer, "rho_R": buffer,
+        "H_L": buffer, "H_R": buffer,
+        "p_L": buffer, "p_R": buffer,
+    }
+    for fun in (signal_speed_Arithmetic, signal_speed_Rusanov, signal_speed_Davis,
+        signal_speed_Einfeldt):
+        fun.lower(buffer, buffer, buffer, buffer, gamma=gamma, **keyword_buffers).compile()
+    for fun in (signal_speed_Davis_2, signal_speed_Toro):
+        fun.jit_static_gamma.lower(buffer, buffer, buffer, buffer, gamma=gamma,
+            **keyword_buffers).compile()
+
+_PRECOMPILE_SHAPE = os.environ.get("JAXFLUIDS_PRECOMPILE_SHAPE")
+if _PRECOMPILE_SHAPE:
+    if ":" in _PRECOMPILE_SHAPE:
+        _shape_str, _dtype_str = _PRECOMPILE_SHAPE.split(":")
+    else:
+        _shape_str, _dtype_str = _PRECOMPILE_SHAPE, None
+    if _dtype_str == "float64":
+        config.update("jax_enable_x64", True)
+    precompile_signal_speeds(tuple(int(cells) for cells in _shape_str.split(",")),
+        dtype=getattr(jnp, _dtype_str) if _dtype_str else None)
\ No newline at end of file
@@ -0,0 +1,160 @@
+#*------------------------------------------------------------------------------*
+#* JAX-FLUIDS -                                                                 *
+#*                                                                              *
+#* A fully-differentiable CFD solver for compressible two-phase flows.          *
+#* Copyright (C) 2022  Deniz A. Bezgin, Aaron B. Buhendwa, Nikolaus A. Adams    *
+#*                                                                              *
+#* This program is free software: you can redistribute it and/or modify         *
+#* it under the terms of the GNU General Public License as published by         *
+#* the Free Software Foundation, either version 3 of the License, or            *
+#* (at your option) any later version.                                          *
+#*                                                                              *
+#* This program is distributed in the hope that it will be useful,              *
+#* but WITHOUT ANY WARRANTY; without even the implied warranty of               *
+#* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the                *
+#* GNU General Public License for more details.                                 *
+#*                                                                              *
+#* You should have received a copy of the GNU General Public License            *
+#* along with this program.  If not, see <https://www.gnu.org/licenses/>.       *
+#*                                                                              *
+#*------------------------------------------------------------------------------*
+#*                                                                              *
+#* CONTACT                                                                      *
+#*                                                                              *
+#* deniz.bezgin@tum.de // aaron.buhendwa@tum.de // nikolaus.adams@tum.de        *
+#*                                                                              *
+#*------------------------------------------------------------------------------*
+#*                                                                              *
+#* Munich, April 15th, 2022                                                     *
+#*                                                                              *
+#*------------------------------------------------------------------------------*
+
+"""Numba implementations of the signal speed estimators.
+
+Optional CPU variants of the estimators in signal_speeds.py operating on
+NumPy buffers. They avoid the per-op dispatch overhead of the JAX variants
+on small grids and auto-vectorize with fastmath. These kernels live outside
+the jitted and differentiable solver path - they are intended for explicit
+use in CPU-only pre- and post-processing. The module imports cleanly when
+numba is not installed; in that case IS_NUMBA_AVAILABLE is False and
+DICT_SIGNAL_SPEEDS_NUMBA is empty.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    IS_NUMBA_AVAILABLE = True
+except ImportError:
+    IS_NUMBA_AVAILABLE = False
+
+if IS_NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signal_speed_Arithmetic(u_L, u_R, a_L, a_R):
+        S_L = np.empty_like(u_L)
+        S_R = np.empty_like(u_R)
+        u_L_, u_R_, a_L_, a_R_ = u_L.ravel(), u_R.ravel(), a_L.ravel(), a_R.ravel()
+        S_L_, S_R_ = S_L.ravel(), S_R.ravel()
+        for i in prange(u_L_.size):
+            u_mean = 0.5 * (u_L_[i] + u_R_[i])
+            a_mean = 0.5 * (a_L_[i] + a_R_[i])
+            S_L_[i] = min(u_mean - a_mean, u_L_[i] - a_L_[i])
+            S_R_[i] = max(u_mean + a_mean, u_R_[i] + a_R_[i])
+        return S_L, S_R
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signal_speed_Rusanov(u_L, u_R, a_L, a_R):
+        S_L = np.empty_like(u_L)
+        S_R = np.empty_like(u_R)
+        u_L_, u_R_, a_L_, a_R_ = u_L.ravel(), u_R.ravel(), a_L.ravel(), a_R.ravel()
+        S_L_, S_R_ = S_L.ravel(), S_R.ravel()
+        for i in prange(u_L_.size):
+            S_plus = max(abs(u_L_[i]) + a_L_[i], abs(u_R_[i]) + a_R_[i])
+            S_L_[i] = -S_plus
+            S_R_[i] = S_plus
+        return S_L, S_R
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signal_speed_Davis(u_L, u_R, a_L, a_R):
+        S_L = np.empty_like(u_L)
+        S_R = np.empty_like(u_R)
+        u_L_, u_R_, a_L_, a_R_ = u_L.ravel(), u_R.ravel(), a_L.ravel(), a_R.ravel()
+        S_L_, S_R_ = S_L.ravel(), S_R.ravel()
+        for i in prange(u_L_.size):
+            S_L_[i] = min(u_L_[i] - a_L_[i], u_R_[i] - a_R_[i])
+            S_R_[i] = max(u_L_[i] + a_L_[i], u_R_[i] + a_R_[i])
+        return S_L, S_R
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signal_speed_Davis_2(u_L, u_R, a_L, a_R, rho_L, rho_R, H_L, H_R, gamma):
+        S_L = np.empty_like(u_L)
+        S_R = np.empty_like(u_R)
+        u_L_, u_R_ = u_L.ravel(), u_R.ravel()
+        rho_L_, rho_R_ = rho_L.ravel(), rho_R.ravel()
+        H_L_, H_R_ = H_L.ravel(), H_R.ravel()
+        S_L_, S_R_ = S_L.ravel(), S_R.ravel()
+        for i in prange(u_L_.size):
+            sqrt_rho_L = math.sqrt(rho_L_[i])
+            sqrt_rho_R = math.sqrt(rho_R_[i])
+            one_dens = 1.0 / (sqrt_rho_L + sqrt_rho_R)
+            u_Roe = (sqrt_rho_L * u_L_[i] + sqrt_rho_R * u_R_[i]) * one_dens
+            H_Roe = (sqrt_rho_L * H_L_[i] + sqrt_rho_R * H_R_[i]) * one_dens
+            a_Roe = math.sqrt((gamma - 1) * max(H_Roe - 0.5 * u_Roe * u_Roe, 0.0))
+            S_L_[i] = u_Roe - a_Roe
+            S_R_[i] = u_Roe + a_Roe
+        return S_L, S_R
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signal_speed_Einfeldt(u_L, u_R, a_L, a_R, rho_L, rho_R):
+        S_L = np.empty_like(u_L)
+        S_R = np.empty_like(u_R)
+        u_L_, u_R_, a_L_, a_R_ = u_L.ravel(), u_R.ravel(), a_L.ravel(), a_R.ravel()
+        rho_L_, rho_R_ = rho_L.ravel(), rho_R.ravel()
+        S_L_, S_R_ = S_L.ravel(), S_R.ravel()
+        for i in prange(u_L_.size):
+            sqrt_rho_L = math.sqrt(rho_L_[i])
+            sqrt_rho_R = math.sqrt(rho_R_[i])
+            one_dens = 1.0 / (sqrt_rho_L + sqrt_rho_R)
+            eta2 = 0.5 * sqrt_rho_L * sqrt_rho_R * one_dens * one_dens
+            u_bar = (sqrt_rho_L * u_L_[i] + sqrt_rho_R * u_R_[i]) * one_dens
+            du = u_R_[i] - u_L_[i]
+            d_bar = math.sqrt((sqrt_rho_L * a_L_[i] * a_L_[i] + sqrt_rho_R * a_R_[i] * a_R_[i]) * one_dens + eta2 * du * du)
+            S_L_[i] = u_bar - d_bar
+            S_R_[i] = u_bar + d_bar
+        return S_L, S_R
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signal_speed_Toro(u_L, u_R, a_L, a_R, rho_L, rho_R, p_L, p_R, gamma):
+        S_L = np.empty_like(u_L)
+        S_R = np.empty_like(u_R)
+        u_L_, u_R_, a_L_, a_R_ = u_L.ravel(), u_R.ravel(), a_L.ravel(), a_R.ravel()
+        rho_L_, rho_R_ = rho_L.ravel(), rho_R.ravel()
+        p_L_, p_R_ = p_L.ravel(), p_R.ravel()
+        S_L_, S_R_ = S_L.ravel(), S_R.ravel()
+        gamma_ = (gamma + 1) * 0.5 / gamma
+        for i in prange(u_L_.size):
+            rho_bar = 0.5 * (rho_L_[i] + rho_R_[i])
+            a_bar = 0.5 * (a_L_[i] + a_R_[i])
+            p_pvrs = 0.5 * (p_L_[i] + p_R_[i]) - 0.5 * (u_R_[i] - u_L_[i]) * rho_bar * a_bar
+            p_star = max(0.0, p_pvrs)
+            q_L = math.sqrt(max(1 + gamma_ * (p_star / p_L_[i] - 1), 0.0)) if p_star > p_L_[i] else 1.0
+            q_R = math.sqrt(max(1 + gamma_ * (p_star / p_R_[i] - 1), 0.0)) if p_star > p_R_[i] else 1.0
+            S_L_[i] = u_L_[i] - a_L_[i] * q_L
+            S_R_[i] = u_R_[i] + a_R_[i] * q_R
+        return S_L, S_R
+
+    DICT_SIGNAL_SPEEDS_NUMBA = {
+        'ARITHMETIC': signal_speed_Arithmetic,
+        'RUSANOV': signal_speed_Rusanov,
+        'DAVIS': signal_speed_Davis,
+        'DAVIS2': signal_speed_Davis_2,
+        'EINFELDT': signal_speed_Einfeldt,
+        'TORO': signal_speed_Toro,
+    }
+
+else:
+
+    DICT_SIGNAL_SPEEDS_NUMBA = {}